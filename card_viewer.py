@@ -1,34 +1,36 @@
 import base64
+import functools
+import html
 import sys
 import os
 import logging
 import json
-import imageio
-from PIL import Image, ImageEnhance
+import re
 import numpy as np
 from typing import Any, Dict, Optional
 import argparse
 
 from PySide6.QtWidgets import QApplication, QMainWindow, QLabel, QGraphicsOpacityEffect, QWidget, QSystemTrayIcon, QSplashScreen
-from PySide6.QtCore import Qt, QTimer, QEventLoop, QPropertyAnimation, QEasingCurve, Slot, QUrl, QSize
+from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QVariantAnimation, QEasingCurve, Slot, Signal, QUrl, QSize, QObject, QRunnable, QThreadPool
 from PySide6.QtNetwork import QTcpServer, QHostAddress
 from PySide6.QtMultimedia import QSoundEffect
 from PySide6.QtSvg import QSvgRenderer
 
-from PySide6.QtCore import Qt, QRect
+from PySide6.QtCore import Qt, QRect, QPointF
 from PySide6.QtGui import (
     QPainter,
     QPixmap,
     QFont,
     QFontMetrics,
+    QFontMetricsF,
     QPainterPath,
     QColor,
     QPen,
     QImage,
-    qRed,
-    qGreen,
-    qBlue,
-    QIcon
+    QIcon,
+    QPixmapCache,
+    QStaticText,
+    QTextOption
 )
 
 # Configure logging
@@ -36,12 +38,74 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def qimage_to_ndarray(image: QImage) -> np.ndarray:
+    """
+    Return a writable (height, width, 4) uint8 NumPy view over the pixels of a 32-bit QImage.
+    Writes to the array modify the image in place, so the image must outlive the view.
+
+    For Format_ARGB32 each pixel is a native-endian 0xAARRGGBB word, so the byte order is
+    B, G, R, A on little-endian machines (alpha at index 3) and A, R, G, B on big-endian ones.
+    """
+    if image.depth() != 32:
+        raise ValueError(f"Expected a 32-bit QImage, got depth {image.depth()}.")
+    height = image.height()
+    arr = np.frombuffer(image.bits(), dtype=np.uint8).reshape(height, image.bytesPerLine() // 4, 4)
+    return arr[:, :image.width()]
+
+
+@functools.lru_cache(maxsize=None)
+def _color_matrix(saturation: float, brightness: float) -> np.ndarray:
+    """
+    Return the 3x3 RGB matrix equivalent to PIL's ImageEnhance.Color(saturation) followed by
+    ImageEnhance.Brightness(1 + brightness / 150), so both can be applied in a single pass.
+    Color blends each pixel with its ITU-R 601-2 luma; Brightness scales towards black.
+    Matrices are memoized per (saturation, brightness) and returned read-only.
+    """
+    luma = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    matrix = saturation * np.eye(3, dtype=np.float32) + (1.0 - saturation) * np.tile(luma, (3, 1))
+    matrix = (matrix * (1.0 + brightness / 150.0)).astype(np.float32)
+    matrix.setflags(write=False)
+    return matrix
+
+
+def _cached_scaled(path: str, size: QSize, smooth: bool = True) -> QPixmap:
+    """
+    Load the image at path scaled to fit size (keeping aspect ratio).
+    The result is stored in QPixmapCache so repeated renders skip the decode and resample.
+    """
+    key = f"{path}@{size.width()}x{size.height()}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        mode = Qt.SmoothTransformation if smooth else Qt.FastTransformation
+        pixmap = QPixmap(path)
+        if pixmap.isNull():
+            return pixmap
+        pixmap = pixmap.scaled(size, Qt.KeepAspectRatio, mode)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
 class CardMakerWidget(QWidget):
     """
     Widget for rendering a card based on provided card data.
     """
 
-    def __init__(self, card_data: Dict[str, Any], background_path: str, base_path: str = "", image_path: str = "", extra_args: dict = None, flags: dict = None ,parent: Optional[QWidget] = None) -> None:
+    # Static asset pixmaps shared by every instance, keyed by full path.
+    _ASSETS: Dict[str, QPixmap] = {}
+    # Star pixmaps pre-scaled to a render height, keyed by (full path, height).
+    _SCALED_STARS: Dict[tuple, QPixmap] = {}
+    # Spell/Trap type text layouts, keyed by (font family, frame type, padding).
+    _SPELL_TRAP_LAYOUTS: Dict[tuple, tuple] = {}
+    # Parsed SVG renderers, keyed by full path.
+    _SVG_RENDERERS: Dict[str, QSvgRenderer] = {}
+    # Fade ramps for _fade_image, keyed by (rows, fade height).
+    _FADE_RAMPS: Dict[tuple, np.ndarray] = {}
+    # Link arrows in a fixed order with their positions; Top and Bottom (indices 0 and 1) are centered on x.
+    _ARROW_ORDER = ("Top", "Bottom", "Left", "Right", "Top-Left", "Top-Right", "Bottom-Left", "Bottom-Right")
+    _ARROW_XY = ((549 // 2, 116), (549 // 2, 562), (35, 304), (482, 304), (46, 126), (453, 126), (46, 534), (453, 534))
+    _ARROW_INDEX = {name: i for i, name in enumerate(_ARROW_ORDER)}
+
+    def __init__(self, card_data: Dict[str, Any], background_path: str, base_path: str = "", image_path: str = "", extra_args: dict = None, flags: dict = None ,parent: Optional[QWidget] = None, art_image: Optional[QImage] = None) -> None:
         super().__init__(parent)
         # Constants for card dimensions
         CARD_WIDTH = 549
@@ -49,6 +113,12 @@ class CardMakerWidget(QWidget):
         self.setFixedSize(CARD_WIDTH, CARD_HEIGHT)
         self.card_data = card_data
         self.base_path = base_path  # Store the base path
+        # Precomputed prefix and separator handling for _get_path.
+        if base_path and not base_path.endswith(os.sep):
+            self._base_prefix = base_path + os.sep
+        else:
+            self._base_prefix = base_path
+        self._sep_needed = os.sep != '/'
 
         # Load images.
         self.background = QPixmap(self._get_path(background_path))
@@ -69,13 +139,13 @@ class CardMakerWidget(QWidget):
             if self.flags.get(key):
                 self.fonts[key] = self.flags[key]
 
-        # Convert b64 image to pixmap.
-        image_data = base64.b64decode(image_path)
-        # Create a QPixmap and load the image data
-        img_pixmap = QPixmap()
-        if not img_pixmap.loadFromData(image_data):
+        # Convert b64 image to pixmap, unless the caller already decoded it.
+        if art_image is None:
+            art_image = self.decode_art(image_path)
+        if art_image.isNull():
             raise ValueError("Failed to load pixmap from base64 data.")
-        self.card_art = img_pixmap
+        self.card_art_image = art_image
+        self.card_art = QPixmap.fromImage(art_image)
 
         if extra_args:
             self.edition = extra_args.get("edition", "")
@@ -86,46 +156,119 @@ class CardMakerWidget(QWidget):
         # self.card_art = QPixmap(self._get_path(self.card_data.get("card_art", "assets/card/frame/blank_art.png")))
         self.art_rect = QRect(66, 146, 417, 417)
         self.pend_art_rect = QRect(38, 144, 477, 455)
-        self.level_star = QPixmap(self._get_path("assets/card/stars/level.png"))
-        self.rank_star = QPixmap(self._get_path("assets/card/stars/rank.png"))
-        # print(self._get_path("assets/card/stars/level.png"))
+        # Art scaled to its rect (and cropped and faded for pendulums), built on first draw.
+        self._art_normal: Optional[QPixmap] = None
+        self._art_pend: Optional[QPixmap] = None
+
+        # Static overlays and link arrows, decoded once per process.
+        self.pend_overlay = self._asset(self._get_path("assets/card/frame/pendulum_frame_internal.png"))
+        self.link_arrows_base = self._asset(self._get_path("assets/card/arrows/link_arrows_base_all.png"))
+        self.arrow_pixmaps = tuple(
+            self._asset(self._get_path(f"assets/card/arrows/{name}.png")) for name in self._ARROW_ORDER
+        )
+
+        # Fitted description fonts, keyed by text, rect size and font bounds.
+        self._fit_cache: Dict[tuple, QFont] = {}
+        # Card name font, bounds and (when compressed) outline path, keyed by text, font size and width.
+        self._name_layouts: Dict[tuple, tuple] = {}
+        # Typeline laid out once on first draw.
+        self._typeline_text: Optional[QStaticText] = None
+        # ATK/DEF font and per-glyph advances for the stat values, which only use these characters.
+        self._stats_font = QFont(self.fonts.get("title_font"), 23.5)
+        stats_metrics = QFontMetricsF(self._stats_font)
+        self._stats_advance = {c: stats_metrics.horizontalAdvance(c) for c in "0123456789?X"}
+
+        # Full card composition reused by paintEvent until invalidate() is called.
+        self._cached_render: Optional[QPixmap] = None
+
+    @staticmethod
+    def decode_art(image_data: str) -> QImage:
+        """
+        Decode base64 card art into a QImage (null if the data is not an image).
+        Only QImage is involved, so this is safe to call from a worker thread.
+        """
+        # Decode once into the premultiplied format the smooth scaler and raster engine work in,
+        # so the pendulum path never has to convert the art per render.
+        art_image = QImage.fromData(base64.b64decode(image_data))
+        if not art_image.isNull() and art_image.format() != QImage.Format_ARGB32_Premultiplied:
+            art_image = art_image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        return art_image
 
     def _get_path(self, relative_path: str) -> str:
         """
         Helper function to construct the full file path using the base path.
-        Splits the relative path string and joins it with base path using os.path.join.
+        Prepends the precomputed base prefix, converting '/' to the platform separator.
+        """
+        if not self.base_path:
+            return relative_path  # If no base path, assume relative to current working directory
+        if self._sep_needed:
+            relative_path = relative_path.replace('/', os.sep)
+        return self._base_prefix + relative_path
+
+    @classmethod
+    def _asset(cls, path: str) -> QPixmap:
+        """
+        Return the pixmap for a static asset, loading it from disk only the first time.
         """
-        path_components = relative_path.split('/')
-        if self.base_path:
-            return os.path.join(self.base_path, *path_components)
-        return relative_path  # If no base path, assume relative to current working directory
+        pixmap = cls._ASSETS.get(path)
+        if pixmap is None:
+            pixmap = QPixmap(path)
+            if pixmap.isNull():
+                logger.error("Error loading asset image: %s", path)
+            cls._ASSETS[path] = pixmap
+        return pixmap
+
+    def _scaled_star(self, kind: str, height: int) -> QPixmap:
+        """
+        Return the level or rank star scaled to the given height, scaling it only once per height.
+        """
+        path = self._get_path(f"assets/card/stars/{kind}.png")
+        pixmap = self._SCALED_STARS.get((path, height))
+        if pixmap is None:
+            pixmap = self._asset(path)
+            if not pixmap.isNull():
+                pixmap = pixmap.scaledToHeight(height, Qt.SmoothTransformation)
+            self._SCALED_STARS[(path, height)] = pixmap
+        return pixmap
 
     def draw_stretched_name(self, painter: QPainter, rect: QRect, text: str, fixed_font_size: int = 22) -> None:
         """
         Draw the card name stretched to fit within the given rectangle.
         """
-        font = QFont(self.fonts.get("title_font"), fixed_font_size, QFont.Normal)
-        path = QPainterPath()
-        path.addText(0, 0, font, text)
-        bounds = path.boundingRect()
+        key = (text, fixed_font_size, rect.width())
+        cached = self._name_layouts.get(key)
+        if cached is None:
+            font = QFont(self.fonts.get("title_font"), fixed_font_size, QFont.Normal)
+            bounds = QFontMetricsF(font).tightBoundingRect(text)
+            path = None
+            if bounds.width() >= rect.width():
+                # Only outline the text when it has to be compressed horizontally.
+                path = QPainterPath()
+                path.addText(0, 0, font, text)
+                bounds = path.boundingRect()
+            cached = (font, bounds, path)
+            self._name_layouts[key] = cached
+        font, bounds, path = cached
+
+        card_type = self.card_data.get("frameType", "").lower()
+        fill_color = QColor(255, 255, 255) if card_type.startswith("xyz") or card_type == "link" or card_type == "spell" or card_type == "trap" else QColor(0, 0, 0)
+        offset_y = round(rect.y() + (rect.height() - bounds.height()) / 2 - bounds.y())
 
-        if bounds.width() < rect.width():
-            scale_factor = 1.0
+        painter.save()
+        if path is None:
             offset_x = round(rect.x() - bounds.x())
+            painter.setFont(font)
+            painter.setPen(fill_color)
+            painter.drawText(offset_x, offset_y, text)
         else:
             scale_factor = rect.width() / bounds.width()
             offset_x = round(rect.x() - bounds.x() * scale_factor)
-
-        offset_y = round(rect.y() + (rect.height() - bounds.height()) / 2 - bounds.y())
-
-        painter.save()
-        painter.translate(offset_x, offset_y)
-        painter.scale(scale_factor, 1)
-        card_type = self.card_data.get("frameType", "").lower()
-        fill_color = QColor(255, 255, 255) if card_type.startswith("xyz") or card_type == "link" or card_type == "spell" or card_type == "trap" else QColor(0, 0, 0)
-        painter.setBrush(fill_color)
-        painter.setPen(Qt.NoPen)
-        painter.drawPath(path)
+            painter.translate(offset_x, offset_y)
+            painter.scale(scale_factor, 1)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(fill_color)
+            painter.setPen(Qt.NoPen)
+            painter.drawPath(path)
         painter.restore()
 
     def draw_fitted_description(
@@ -144,31 +287,69 @@ class CardMakerWidget(QWidget):
         lore = False
         if not pend:
             lore = self.card_data.get("frameType", "").lower().startswith("normal")
-        chosen_font: Optional[QFont] = None
 
         if lore:
             text = text.strip('\'"')
 
-        for font_size in range(max_font_size, min_font_size - 1, -1):
-            letter_spacing = 0.0
-            while letter_spacing >= min_letter_spacing:
-                font_family = self.fonts.get("lore_font") if lore else self.fonts.get("main_font")
-                font = QFont(font_family, font_size, QFont.Light)
-                font.setLetterSpacing(QFont.AbsoluteSpacing, letter_spacing)
-                font.setHintingPreference(QFont.HintingPreference.PreferFullHinting)
-                metrics = QFontMetrics(font)
-                bounding = metrics.boundingRect(rect, Qt.TextWordWrap, text)
-                if bounding.height() <= rect.height():
-                    chosen_font = font
-                    break
-                letter_spacing -= 0.5
-            if chosen_font is not None:
-                break
+        key = (text, rect.width(), rect.height(), lore, max_font_size, min_font_size, min_letter_spacing)
+        chosen_font: Optional[QFont] = self._fit_cache.get(key)
+        if chosen_font is not None:
+            painter.setFont(chosen_font)
+            painter.drawText(rect, Qt.TextWordWrap, text)
+            return
+
+        font_family = self.fonts.get("lore_font") if lore else self.fonts.get("main_font")
+
+        def make_font(font_size: int, letter_spacing: float) -> QFont:
+            font = QFont(font_family, font_size, QFont.Light)
+            font.setLetterSpacing(QFont.AbsoluteSpacing, letter_spacing)
+            font.setHintingPreference(QFont.HintingPreference.PreferFullHinting)
+            return font
+
+        def fits(font: QFont) -> bool:
+            bounding = QFontMetrics(font).boundingRect(rect, Qt.TextWordWrap, text)
+            return bounding.height() <= rect.height()
+
+        # Letter spacings tried per size, from normal down to the tightest allowed.
+        spacings = []
+        letter_spacing = 0.0
+        while letter_spacing >= min_letter_spacing:
+            spacings.append(letter_spacing)
+            letter_spacing -= 0.5
+
+        if spacings:
+            # Most descriptions fit at the largest size with normal spacing, so try that first.
+            font = make_font(max_font_size, spacings[0])
+            if fits(font):
+                chosen_font = font
+
+        if chosen_font is None and spacings:
+            # Text height grows with font size, so binary-search the largest size that fits at the
+            # tightest spacing, then use the loosest spacing that still fits at that size.
+            best_size = None
+            low, high = min_font_size, max_font_size
+            while low <= high:
+                mid = (low + high) // 2
+                if fits(make_font(mid, spacings[-1])):
+                    best_size = mid
+                    low = mid + 1
+                else:
+                    high = mid - 1
+
+            if best_size is not None:
+                for letter_spacing in spacings[:-1]:
+                    font = make_font(best_size, letter_spacing)
+                    if fits(font):
+                        chosen_font = font
+                        break
+                else:
+                    chosen_font = make_font(best_size, spacings[-1])
 
         if chosen_font is None:
             chosen_font = QFont(self.fonts.get("main_font"), min_font_size, QFont.Normal)
             chosen_font.setLetterSpacing(QFont.AbsoluteSpacing, min_letter_spacing)
 
+        self._fit_cache[key] = chosen_font
         painter.setFont(chosen_font)
         painter.drawText(rect, Qt.TextWordWrap, text)
 
@@ -181,12 +362,13 @@ class CardMakerWidget(QWidget):
         except (ValueError, TypeError):
             level = 0
         stars_count = min(level, max_stars)
-
-        if self.level_star.isNull() or stars_count <= 0:
+        if stars_count <= 0:
             return
 
         star_height = rect.height()
-        star_scaled = self.level_star.scaledToHeight(star_height, Qt.SmoothTransformation)
+        star_scaled = self._scaled_star("level", star_height)
+        if star_scaled.isNull():
+            return
         star_width = star_scaled.width()
         gap = 4
 
@@ -204,12 +386,13 @@ class CardMakerWidget(QWidget):
         except (ValueError, TypeError):
             level = 0
         stars_count = min(level, max_stars)
-
-        if self.rank_star.isNull() or stars_count <= 0:
+        if stars_count <= 0:
             return
 
         star_height = rect.height()
-        star_scaled = self.rank_star.scaledToHeight(star_height, Qt.SmoothTransformation)
+        star_scaled = self._scaled_star("rank", star_height)
+        if star_scaled.isNull():
+            return
         star_width = star_scaled.width()
         gap = 4
 
@@ -229,17 +412,23 @@ class CardMakerWidget(QWidget):
     def _fade_image(self, image: QImage, fade_start: int, fade_height: int) -> QImage:
         """
         Apply a vertical fade effect to the provided image.
+        Expects an ARGB32_Premultiplied image, which is modified in place. All four channels
+        are scaled by the ramp so the colour stays premultiplied by the faded alpha.
         """
-        for y in range(fade_start, image.height()):
-            fade_progress = (y - fade_start) / float(fade_height)
-            alpha = int(255 * (1.0 - fade_progress))
-            alpha = max(0, min(255, alpha))
-            for x in range(image.width()):
-                pixel = image.pixel(x, y)
-                r = qRed(pixel)
-                g = qGreen(pixel)
-                b = qBlue(pixel)
-                image.setPixelColor(x, y, QColor(r, g, b, alpha))
+        height = image.height()
+        if fade_start >= height:
+            return image
+
+        arr = qimage_to_ndarray(image)
+
+        ramp_key = (height - fade_start, fade_height)
+        ramp = self._FADE_RAMPS.get(ramp_key)
+        if ramp is None:
+            rows = np.arange(height - fade_start, dtype=np.float32)
+            ramp = np.clip(255 * (1.0 - rows / float(fade_height)), 0, 255).astype(np.uint16)
+            self._FADE_RAMPS[ramp_key] = ramp
+        faded = arr[fade_start:].astype(np.uint16) * ramp[:, None, None] // 255
+        arr[fade_start:] = faded.astype(np.uint8)
         return image
 
     def _draw_card_art(self, painter: QPainter, pendulum: bool) -> None:
@@ -251,34 +440,31 @@ class CardMakerWidget(QWidget):
 
         if pendulum:
             art_rect = self.pend_art_rect
-            scaled_art = self.card_art.scaledToWidth(art_rect.width(), Qt.SmoothTransformation)
-            art_x, art_y = art_rect.x(), art_rect.y()
-
-            # Crop and apply fade to the art image.
-            crop_height = 465
-            crop_rect = QRect(0, 0, scaled_art.width(), crop_height)
-            cropped_art = scaled_art.copy(crop_rect)
-
-            scaled_image = cropped_art.toImage()
-            if scaled_image.format() != QImage.Format_ARGB32:
-                scaled_image = scaled_image.convertToFormat(QImage.Format_ARGB32)
-
-            fade_end = 100
-            fade_height = 90
-            fade_start = max(0, scaled_image.height() - fade_end)
-            faded_image = self._fade_image(scaled_image, fade_start, fade_height)
-            faded_art = QPixmap.fromImage(faded_image)
-            painter.drawPixmap(art_x, art_y, faded_art)
+            if self._art_pend is None:
+                scaled_art = self.card_art_image.scaledToWidth(art_rect.width(), Qt.SmoothTransformation)
+
+                # Crop and apply fade to the art image.
+                crop_height = 465
+                crop_rect = QRect(0, 0, scaled_art.width(), crop_height)
+                scaled_image = scaled_art.copy(crop_rect)
+
+                fade_end = 100
+                fade_height = 90
+                fade_start = max(0, scaled_image.height() - fade_end)
+                faded_image = self._fade_image(scaled_image, fade_start, fade_height)
+                self._art_pend = QPixmap.fromImage(faded_image)
+            painter.drawPixmap(art_rect.x(), art_rect.y(), self._art_pend)
         else:
-            scaled_art = self.card_art.scaled(self.art_rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if self._art_normal is None:
+                self._art_normal = self.card_art.scaled(self.art_rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            scaled_art = self._art_normal
             art_x = self.art_rect.x() + (self.art_rect.width() - scaled_art.width()) // 2
             art_y = self.art_rect.y() + (self.art_rect.height() - scaled_art.height()) // 2
             painter.drawPixmap(art_x, art_y, scaled_art)
 
     def _draw_pendulum_frame(self, painter: QPainter) -> None:
         """Draw the pendulum frame overlay."""
-        pend_overlay = QPixmap(self._get_path("assets/card/frame/pendulum_frame_internal.png"))
-        painter.drawPixmap(0, 0, self.width(), self.height(), pend_overlay)
+        painter.drawPixmap(0, 0, self.width(), self.height(), self.pend_overlay)
 
     def _draw_link_arrows(self, painter: QPainter) -> None:
         """Draw link arrows as specified in card data."""
@@ -286,32 +472,33 @@ class CardMakerWidget(QWidget):
         if not link_arrows:
             return
 
-        base_link_arrows = QPixmap(self._get_path("assets/card/arrows/link_arrows_base_all.png"))
-        painter.drawPixmap(0, 0, self.width(), self.height(), base_link_arrows)
-
-        arrow_positions = {
-            "Top": (self.width() // 2, 116),
-            "Bottom": (self.width() // 2, 562),
-            "Left": (35, 304),
-            "Right": (482, 304),
-            "Top-Left": (46, 126),
-            "Top-Right": (453, 126),
-            "Bottom-Left": (46, 534),
-            "Bottom-Right": (453, 534),
-        }
-
-        for arrow in link_arrows:
-            arrow_name = arrow
-            arrow_image_path = self._get_path(f"assets/card/arrows/{arrow_name}.png")
-            arrow_pixmap = QPixmap(arrow_image_path)
-            if arrow_pixmap.isNull():
-                logger.error("Error loading arrow image: %s", arrow_image_path)
-                continue
-
-            pos = arrow_positions.get(arrow_name, (0, 0))
-            x, y = pos
+        unknown = [name for name in link_arrows if name not in self._ARROW_INDEX]
+        if unknown:
+            logger.error("Unknown link arrows: %s", ", ".join(unknown))
+        indices = sorted({self._ARROW_INDEX[name] for name in link_arrows if name in self._ARROW_INDEX})
+
+        # The base and arrows are composited once per marker combination and reused from QPixmapCache.
+        key = f"link_arrows:{self.base_path}:{','.join(map(str, indices))}"
+        composite = QPixmapCache.find(key)
+        if composite is None or composite.isNull():
+            composite = QPixmap(self.size())
+            composite.fill(Qt.transparent)
+            arrow_painter = QPainter(composite)
+            self._compose_link_arrows(arrow_painter, indices)
+            arrow_painter.end()
+            QPixmapCache.insert(key, composite)
+
+        painter.drawPixmap(0, 0, composite)
+
+    def _compose_link_arrows(self, painter: QPainter, indices: list) -> None:
+        """Draw the link arrow base and the arrows at the given _ARROW_ORDER indices with the given painter."""
+        painter.drawPixmap(0, 0, self.width(), self.height(), self.link_arrows_base)
+
+        for index in indices:
+            arrow_pixmap = self.arrow_pixmaps[index]
+            x, y = self._ARROW_XY[index]
             # Center adjustments for common arrow types.
-            if arrow_name in ("Top", "Bottom"):
+            if index < 2:
                 x -= arrow_pixmap.width() // 2
 
             painter.drawPixmap(x, y, arrow_pixmap)
@@ -336,7 +523,15 @@ class CardMakerWidget(QWidget):
 
     def load_svg_with_antialiasing(self, path: str, target_size: QSize) -> QPixmap:
         """Load an SVG file and return a QPixmap rendered with anti-aliasing."""
-        renderer = QSvgRenderer(path)
+        key = f"svg:{path}@{target_size.width()}x{target_size.height()}"
+        cached = QPixmapCache.find(key)
+        if cached is not None and not cached.isNull():
+            return cached
+
+        renderer = self._SVG_RENDERERS.get(path)
+        if renderer is None:
+            renderer = QSvgRenderer(path)
+            self._SVG_RENDERERS[path] = renderer
         # Create an image with an alpha channel
         image = QImage(target_size, QImage.Format_ARGB32)
         image.fill(Qt.transparent)
@@ -347,15 +542,61 @@ class CardMakerWidget(QWidget):
         renderer.render(painter_img)
         painter_img.end()
 
-        return QPixmap.fromImage(image)
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _spell_trap_layout(self, frame_type: str, padding: str) -> tuple:
+        """
+        Build (or reuse) the Spell/Trap type text layout as (runs, total_width, baseline_offset).
+        Each run is a (font, text, advance) tuple; layouts are shared across cards at class level.
+        """
+        key = (self.fonts.get("main_font"), frame_type, padding)
+        layout = self._SPELL_TRAP_LAYOUTS.get(key)
+        if layout is not None:
+            return layout
+
+        base_font = QFont(self.fonts.get("main_font"), 19.5, QFont.Bold)
+
+        # Scaled font for non-capitalized letters
+        scale_factor = 0.85
+        scaled_font = QFont(self.fonts.get("main_font"), base_font.pointSizeF() * scale_factor, QFont.Bold)
+
+        # Larger font for brackets
+        bracket_scale = 1.10
+        bracket_font = QFont(self.fonts.get("main_font"), base_font.pointSizeF() * bracket_scale, QFont.Bold)
+
+        # Font metrics
+        base_metrics = QFontMetrics(base_font)
+        scaled_metrics = QFontMetrics(scaled_font)
+        bracket_metrics = QFontMetrics(bracket_font)
+
+        # Text components
+        ft_first = frame_type[0] if frame_type else ""
+        ft_rest = frame_type[1:] if len(frame_type) > 1 else ""
+
+        # Layout as (font, text, advance) runs; adjacent glyphs sharing a font are measured and
+        # drawn together, and whitespace only advances the pen.
+        runs = (
+            (bracket_font, "[", bracket_metrics.horizontalAdvance("[")),
+            (base_font, ft_first, base_metrics.horizontalAdvance(ft_first)),
+            (scaled_font, ft_rest, scaled_metrics.horizontalAdvance(ft_rest)),
+            (base_font, " C", base_metrics.horizontalAdvance(" C")),
+            (scaled_font, "ARD", scaled_metrics.horizontalAdvance("ARD")),
+            (base_font, padding, base_metrics.horizontalAdvance(padding) if padding else 0),
+            (bracket_font, "]", bracket_metrics.horizontalAdvance("]")),
+        )
+        total_width = sum(advance for _, _, advance in runs)
+        baseline_offset = (base_metrics.ascent() - base_metrics.descent()) / 2
+
+        layout = (runs, total_width, baseline_offset)
+        self._SPELL_TRAP_LAYOUTS[key] = layout
+        return layout
 
     def _draw_spell_trap_text(self, painter: QPainter) -> None:
         """Draw the Spell/Trap type text with resized brackets and scaled letters."""
         card_type = self.card_data.get("type", "")
         if card_type in ("Spell Card", "Trap Card"):
-            base_font = QFont(self.fonts.get("main_font"), 19.5, QFont.Bold)
-            painter.setFont(base_font)
-
             # Default text rectangle
             st_text_rect = QRect(300, 90, 202, 44)
             text_padding = ""
@@ -370,85 +611,20 @@ class CardMakerWidget(QWidget):
                 st_text_rect = QRect(290, 90, 202, 44)
 
             frame_type = self.card_data.get("frameType", "").upper()
-
-            # Scaled font for non-capitalized letters
-            scale_factor = 0.85
-            scaled_font = QFont(self.fonts.get("main_font"), base_font.pointSizeF() * scale_factor, QFont.Bold)
-
-            # Larger font for brackets
-            bracket_scale = 1.10
-            bracket_font = QFont(self.fonts.get("main_font"), base_font.pointSizeF() * bracket_scale, QFont.Bold)
-
-            # Font metrics
-            base_metrics = QFontMetrics(base_font)
-            scaled_metrics = QFontMetrics(scaled_font)
-            bracket_metrics = QFontMetrics(bracket_font)
-
-            # Text components
-            left_bracket = "["
-            right_bracket = "]"
-            ft_first = frame_type[0] if frame_type else ""
-            ft_rest = frame_type[1:] if len(frame_type) > 1 else ""
-            space = " "
-            card_first = "C"
-            card_rest = "ARD"
-            padding = text_padding
-
-            # Measure widths
-            w_left_bracket = bracket_metrics.horizontalAdvance(left_bracket)
-            w_ft_first = base_metrics.horizontalAdvance(ft_first)
-            w_ft_rest = scaled_metrics.horizontalAdvance(ft_rest)
-            w_space = base_metrics.horizontalAdvance(space)
-            w_card_first = base_metrics.horizontalAdvance(card_first)
-            w_card_rest = scaled_metrics.horizontalAdvance(card_rest)
-            w_padding = base_metrics.horizontalAdvance(padding)
-            w_right_bracket = bracket_metrics.horizontalAdvance(right_bracket)
-
-            total_width = (w_left_bracket + w_ft_first + w_ft_rest +
-                           w_space + w_card_first + w_card_rest +
-                           w_padding + w_right_bracket)
+            runs, total_width, baseline_offset = self._spell_trap_layout(frame_type, text_padding)
 
             start_x = st_text_rect.x() + (st_text_rect.width() - total_width) / 2
-            base_baseline = st_text_rect.y() + (st_text_rect.height() + base_metrics.ascent() - base_metrics.descent()) / 2
+            base_baseline = st_text_rect.y() + st_text_rect.height() / 2 + baseline_offset
 
             current_x = start_x
-
-            # Draw left bracket (larger font)
-            painter.setFont(bracket_font)
-            painter.drawText(current_x, base_baseline, left_bracket)
-            current_x += w_left_bracket
-
-            # Draw frame type (first letter full size, rest smaller)
-            painter.setFont(base_font)
-            painter.drawText(current_x, base_baseline, ft_first)
-            current_x += w_ft_first
-
-            painter.setFont(scaled_font)
-            painter.drawText(current_x, base_baseline, ft_rest)
-            current_x += w_ft_rest
-
-            # Draw space
-            painter.setFont(base_font)
-            painter.drawText(current_x, base_baseline, space)
-            current_x += w_space
-
-            # Draw "CARD" (first letter full size, rest smaller)
-            painter.setFont(base_font)
-            painter.drawText(current_x, base_baseline, card_first)
-            current_x += w_card_first
-
-            painter.setFont(scaled_font)
-            painter.drawText(current_x, base_baseline, card_rest)
-            current_x += w_card_rest
-
-            # Draw optional padding
-            painter.setFont(base_font)
-            painter.drawText(current_x, base_baseline, padding)
-            current_x += w_padding
-
-            # Draw right bracket (larger font)
-            painter.setFont(bracket_font)
-            painter.drawText(current_x, base_baseline, right_bracket)
+            current_font = None
+            for font, text, advance in runs:
+                if text.strip():
+                    if font is not current_font:
+                        painter.setFont(font)
+                        current_font = font
+                    painter.drawText(current_x, base_baseline, text)
+                current_x += advance
 
     def _draw_attribute(self, painter: QPainter) -> None:
         """Draw the attribute icon on the card."""
@@ -460,10 +636,9 @@ class CardMakerWidget(QWidget):
             attribute_text = self.card_data.get("attribute", "")
             ext_attr = "png"
         attribute_path = self._get_path(f"assets/card/attribute/{attribute_text.lower()}.{ext_attr}")
-        attribute_pixmap = QPixmap(attribute_path)
-        if not attribute_pixmap.isNull():
-            attribute_rect = QRect(458, 36, 55, 55)
-            scaled_attribute = attribute_pixmap.scaled(attribute_rect.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        attribute_rect = QRect(458, 36, 55, 55)
+        scaled_attribute = _cached_scaled(attribute_path, attribute_rect.size())
+        if not scaled_attribute.isNull():
             x_offset = attribute_rect.x() + (attribute_rect.width() - scaled_attribute.width()) // 2
             y_offset = attribute_rect.y() + (attribute_rect.height() - scaled_attribute.height()) // 2
             painter.drawPixmap(x_offset, y_offset, scaled_attribute)
@@ -475,40 +650,47 @@ class CardMakerWidget(QWidget):
             return
 
         typeline_rect = QRect(40, 600, 420, 30)
-        x = typeline_rect.x()
         font_size = 15
         font_percentage = 0.85
         front_font_offset = 1
 
         front_font = QFont(self.fonts.get("main_font"), font_size + front_font_offset, QFont.Bold)
         full_font = QFont(self.fonts.get("main_font"), font_size, QFont.Bold)
-        small_font = QFont(self.fonts.get("main_font"), int(font_size * font_percentage), QFont.Bold)
         fm_full = QFontMetrics(full_font)
         baseline = typeline_rect.y() + (typeline_rect.height() + fm_full.ascent() - fm_full.descent()) // 2
 
-        painter.setFont(front_font)
-        painter.drawText(x, baseline, "[")
-        x += QFontMetrics(full_font).horizontalAdvance("[")
-
-        typeline_words = self.card_data.get("typeline", [])
-        for i, word in enumerate(typeline_words):
-            if word:
-                first_letter = word[0].upper()
-                painter.setFont(full_font)
-                painter.drawText(x, baseline, first_letter)
-                x += QFontMetrics(full_font).horizontalAdvance(first_letter)
-                if len(word) > 1:
-                    rest = word[1:].upper()
-                    painter.setFont(small_font)
-                    painter.drawText(x, baseline, rest)
-                    x += QFontMetrics(small_font).horizontalAdvance(rest)
-            if i < len(typeline_words) - 1:
-                separator = "/"
-                painter.setFont(front_font)
-                painter.drawText(x, baseline, separator)
-                x += QFontMetrics(full_font).horizontalAdvance(separator)
-        painter.setFont(front_font)
-        painter.drawText(x, baseline, "]")
+        if self._typeline_text is None:
+            # Lay the whole typeline out once as rich text: brackets and separators in the front size,
+            # the first letter of each word in the full size and the rest in the small size.
+            front_size = font_size + front_font_offset
+            small_size = int(font_size * font_percentage)
+            words = []
+            for word in self.card_data.get("typeline", []):
+                markup = ""
+                if word:
+                    markup = html.escape(word[0].upper())
+                    if len(word) > 1:
+                        markup += f"<span style='font-size:{small_size}pt'>{html.escape(word[1:].upper())}</span>"
+                words.append(markup)
+            separator = f"<span style='font-size:{front_size}pt'>/</span>"
+            self._typeline_text = QStaticText(
+                f"<span style='font-size:{front_size}pt'>[</span>"
+                + separator.join(words)
+                + f"<span style='font-size:{front_size}pt'>]</span>"
+            )
+            self._typeline_text.setTextFormat(Qt.RichText)
+            # Without a width the rich-text layout sizes itself and wraps at the separators,
+            # so pin it to the typeline box and keep it on one line like the per-segment drawing did.
+            self._typeline_text.setTextWidth(typeline_rect.width())
+            typeline_option = QTextOption()
+            typeline_option.setWrapMode(QTextOption.NoWrap)
+            self._typeline_text.setTextOption(typeline_option)
+            self._typeline_text.prepare(painter.transform(), full_font)
+
+        # The line's ascent comes from its largest font, the brackets.
+        top = baseline - QFontMetricsF(front_font).ascent()
+        painter.setFont(full_font)
+        painter.drawStaticText(QPointF(typeline_rect.x(), top), self._typeline_text)
 
     def _draw_description(self, painter: QPainter, pendulum: bool) -> None:
         """Draw the card description (or pendulum-specific description if applicable)."""
@@ -553,8 +735,14 @@ class CardMakerWidget(QWidget):
 
         # Get the current font as the base font.
         base_font = painter.font()
-        fm = QFontMetrics(base_font)
-        text_width = fm.horizontalAdvance(text)
+        text_width = None
+        if base_font == self._stats_font:
+            try:
+                text_width = sum(self._stats_advance[c] for c in text)
+            except KeyError:
+                pass
+        if text_width is None:
+            text_width = QFontMetricsF(base_font).horizontalAdvance(text)
 
         # If for some reason text width is zero, just draw normally.
         if text_width <= 0:
@@ -588,7 +776,7 @@ class CardMakerWidget(QWidget):
 
     def _draw_stats(self, painter: QPainter, link: bool) -> None:
         # Set the base font for your card design.
-        painter.setFont(QFont(self.fonts.get("title_font"), 23.5))
+        painter.setFont(self._stats_font)
 
         # Draw the "ATK/" label.
         atk_stats_text = "ATK/"
@@ -604,7 +792,7 @@ class CardMakerWidget(QWidget):
 
         # If the card isn't a LINK card, do the same for DEF.
         if not link:
-            painter.setFont(QFont(self.fonts.get("title_font"), 23.5))
+            painter.setFont(self._stats_font)
             deff = self.card_data.get("def", "")
             if deff == -1:
                 deff = "?"
@@ -719,6 +907,7 @@ class CardMakerWidget(QWidget):
             painter.setBrush(fill_color)
             # Optionally, set the pen. Qt.NoPen avoids drawing a border.
             painter.setPen(Qt.NoPen)
+            painter.setRenderHint(QPainter.Antialiasing)
             # Draw the rounded square; the last two parameters are the x and y radii for the rounded corners.
             painter.drawRoundedRect(rect, 5, 5)
 
@@ -726,7 +915,7 @@ class CardMakerWidget(QWidget):
 
     def _draw_card_content(self, painter: QPainter):  # NEW METHOD: Encapsulates all drawing
         """Draws all the card content using the provided painter."""
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Geometry antialiasing is only enabled around the curved shapes that need it
         painter.setRenderHint(QPainter.TextAntialiasing)
         painter.setRenderHint(QPainter.VerticalSubpixelPositioning)
 
@@ -762,25 +951,41 @@ class CardMakerWidget(QWidget):
     def paintEvent(self, event: Any) -> None:
         """
         Main paint event handler that composes all parts of the card.
+        The composition is rendered once and blitted on later repaints.
         """
+        if self._cached_render is None:
+            self._cached_render = self.render_to_pixmap(self.width(), self.height())
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        painter.setRenderHint(QPainter.TextAntialiasing, True)
-        self._draw_card_content(painter) # Call the new method
+        painter.drawPixmap(0, 0, self._cached_render)
         painter.end()
 
+    def invalidate(self) -> None:
+        """
+        Drop the cached composition and per-card layouts after card_data or flags change,
+        and schedule a repaint.
+        """
+        self._cached_render = None
+        self._typeline_text = None
+        self.update()
 
-    def render_to_pixmap(self, width: int, height: int) -> QPixmap:
+    def render_to_image(self, width: int, height: int) -> QImage:
         """
-        Renders the card content to a QPixmap of the specified size.
+        Renders the card content to a premultiplied ARGB32 QImage of the specified size,
+        the format the raster paint engine blends fastest.
         """
-        pixmap = QPixmap(width, height)
-        pixmap.fill(Qt.GlobalColor.transparent) # Important: Make background transparent initially
+        image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent) # Important: Make background transparent initially
 
-        painter = QPainter(pixmap)
+        painter = QPainter(image)
         self._draw_card_content(painter) # Reuse the same drawing logic
         painter.end()
-        return pixmap
+        return image
+
+    def render_to_pixmap(self, width: int, height: int) -> QPixmap:
+        """
+        Renders the card content to a QPixmap of the specified size.
+        """
+        return QPixmap.fromImage(self.render_to_image(width, height))
 
     def save_card_to_file(self, filename: str, width: int, height: int) -> bool:
         """
@@ -791,7 +996,33 @@ class CardMakerWidget(QWidget):
         return pixmap.save(filename, "PNG")  # PNG format supports transparency
 
 
+class _ArtDecodeSignals(QObject):
+    # Request id and the decoded art (a null QImage if the data was invalid).
+    decoded = Signal(int, object)
+
+
+class _ArtDecodeTask(QRunnable):
+    """Decode a card's base64 art on a pool thread and report back through the given signals."""
+
+    def __init__(self, request_id: int, image_data: str, signals: _ArtDecodeSignals) -> None:
+        super().__init__()
+        self.request_id = request_id
+        self.image_data = image_data
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            art_image = CardMakerWidget.decode_art(self.image_data)
+        except ValueError:
+            # Malformed base64; CardMakerWidget reports the null image on the GUI thread.
+            art_image = QImage()
+        self.signals.decoded.emit(self.request_id, art_image)
+
+
 class OverlayServer(QTcpServer):
+    # JSON whitespace between messages.
+    _WHITESPACE = re.compile(r"[ \t\n\r]*")
+
     def __init__(self, main_window, rootpath ,args=None):
         super().__init__(main_window)
         self.args = args
@@ -799,12 +1030,25 @@ class OverlayServer(QTcpServer):
         self.newConnection.connect(self.handle_new_connection)
         self.buffers = {}
         self.rootpath = rootpath
+        # Shown for any message that is not a new card; loaded once instead of per message.
+        self._default_pix = QPixmap(os.path.join(rootpath, "Default.png"))
+        # Shared decoder for pulling complete messages out of a connection's buffer.
+        self._decoder = json.JSONDecoder()
+        # The flags never change while serving, so their part of the render cache key is computed once.
+        self._flags_key = hash(frozenset(args.items())) if args else 0
+        # Cards are numbered as they arrive, so a render that finishes late never replaces a newer card.
+        self._request_id = 0
+        self._shown_request = 0
+        # Render arguments for cards whose art is still being decoded, keyed by request id.
+        self._pending_renders = {}
+        self._art_signals = _ArtDecodeSignals(self)
+        self._art_signals.decoded.connect(self._on_art_decoded)
 
     @Slot()
     def handle_new_connection(self):
         client_connection = self.nextPendingConnection()
         # Initialize a buffer for the new connection
-        self.buffers[client_connection] = b""
+        self.buffers[client_connection] = bytearray()
         client_connection.readyRead.connect(self.read_client)
         client_connection.disconnected.connect(lambda: self.buffers.pop(client_connection, None))
 
@@ -813,28 +1057,60 @@ class OverlayServer(QTcpServer):
         if socket is None:
             return
 
-        # Read new data and convert the QByteArray to bytes.
+        # Append new data to the connection's growable buffer in place.
         new_data = socket.readAll()
-        self.buffers[socket] += bytes(new_data)
+        buffer = self.buffers[socket]
+        buffer.extend(new_data.data())
 
+        tail = b""
         try:
-            # Convert buffered bytes to a string and try to decode JSON.
-            data_str = self.buffers[socket].decode("utf-8").strip()
-            data = json.loads(data_str)
-        except json.decoder.JSONDecodeError:
-            # Incomplete JSON, wait for more data.
+            text = buffer.decode("utf-8")
+        except UnicodeDecodeError as e:
+            if e.reason != "unexpected end of data":
+                logger.error("Dropping invalid UTF-8 from client: %s", e)
+                buffer.clear()
+                return
+            # A multi-byte character split across reads; decode up to it and keep its bytes for later.
+            text = buffer[:e.start].decode("utf-8")
+            tail = bytes(buffer[e.start:])
+
+        # Decode every complete message; whatever follows the last one stays buffered.
+        messages = []
+        end = 0
+        while True:
+            start = self._WHITESPACE.match(text, end).end()
+            if start == len(text):
+                end = start
+                break
+            try:
+                data, end = self._decoder.raw_decode(text, start)
+            except json.JSONDecodeError:
+                # Incomplete JSON, wait for more data.
+                break
+            messages.append(data)
+
+        if not messages:
             return
+        self.buffers[socket] = bytearray(text[end:].encode("utf-8") + tail)
+
+        for data in messages:
+            self._handle_message(data)
+            socket.write(b"ACK")
 
-        # Clear the buffer for this socket since we've processed the message.
-        self.buffers[socket] = b""
+        # Disconnect once everything received has been handled.
+        if not self.buffers[socket]:
+            socket.disconnectFromHost()
 
+    def _handle_message(self, data):
+        """Render the card described by one decoded message and schedule the overlay update."""
+        self._request_id += 1
+        request_id = self._request_id
         frame_type = "Default"
-        card_pix = QPixmap("Default.png")
+        card_pix = self._default_pix
 
         if data.get("status") == "NewCard":
-            background_path = "default.png.none"  # Ensure this image is 549x800
-            card_data = data.get("card_data", "")
-            card_data = json.loads(card_data)
+            raw_card_data = data.get("card_data", "")
+            card_data = json.loads(raw_card_data)
             image_path = data.get("card_image", "")
             frame_type = card_data.get("frameType", "Default")
 
@@ -849,42 +1125,101 @@ class OverlayServer(QTcpServer):
                 "passcode": passcode
                           }
 
+            # The same card is often scanned repeatedly, so reuse its finished render.
+            # The card data and art are part of the key in case they differ for one passcode.
+            cache_key = (f"card:{passcode}:{edition}:{set_string}:"
+                         f"{hash((raw_card_data, image_path))}:{self._flags_key}")
+            card_pix = QPixmapCache.find(cache_key)
+            if card_pix is None:
+                # Start the transition now and decode the art on a pool thread meanwhile. The widget and its
+                # pixmaps can only be used on this thread, so the card itself is rendered once the art comes
+                # back and handed to the running transition (see _on_art_decoded).
+                self._pending_renders[request_id] = (card_data, image_path, extra_args, cache_key)
+                QThreadPool.globalInstance().start(_ArtDecodeTask(request_id, image_path, self._art_signals))
+
+        self._show_card(request_id, frame_type, card_pix)
+
+    def _on_art_decoded(self, request_id, art_image):
+        """Render a card once its art has been decoded and deliver it if it is still the latest card."""
+        card_data, image_path, extra_args, cache_key = self._pending_renders.pop(request_id)
+        if request_id != self._shown_request:
+            return
+
+        background_path = "default.png.none"  # Ensure this image is 549x800
+        try:
             card_widget = CardMakerWidget(card_data,
                                           background_path,
                                           base_path=os.path.join(self.rootpath ,"painted"),
                                           image_path=image_path,
                                           extra_args=extra_args,
-                                          flags=self.args
+                                          flags=self.args,
+                                          art_image=art_image
                                           )
-
+        except ValueError as e:
+            # The transition is already running, so finish it on the default card.
+            logger.error("Could not render card: %s", e)
+            card_pix = self._default_pix
+        else:
             # Define the desired dimensions and filename
             output_width = 549
             output_height = 800
             card_pix = card_widget.render_to_pixmap(output_width, output_height)
+            QPixmapCache.insert(cache_key, card_pix)
+        self.main_window.deliver_overlay(card_pix)
 
-        # Write ACK and disconnect immediately.
-        socket.write(b"ACK")
-        socket.disconnectFromHost()
+    def _show_card(self, request_id, frame_type, card_pix):
+        """Start the transition to a card; card_pix is None while the card is still being rendered."""
+        self._shown_request = request_id
+        # set_overlay_custom only starts animations, so it can run directly; calling it before any
+        # deliver_overlay for this request keeps the two in order.
+        self.main_window.set_overlay_custom(frame=frame_type, card_pixmap=card_pix)
 
-        # Schedule the overlay update after the network event is fully processed.
-        QTimer.singleShot(0, lambda: self.main_window.set_overlay_custom(frame=frame_type, card_pixmap=card_pix))
+
+@functools.lru_cache(maxsize=2)
+def _decode_frames(image_path):
+    """
+    Decode every frame of an (optionally animated) image into one read-only
+    (frames, height, width, 4) RGBA uint8 array.
+    The most recent files are kept, so consecutive variants of one source share a single decode.
+    """
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        count = getattr(image, "n_frames", 1)
+        width, height = image.size
+        frames = np.empty((count, height, width, 4), dtype=np.uint8)
+        for i in range(count):
+            image.seek(i)
+            # Copy straight out of frames that are already RGBA instead of converting them first.
+            frames[i] = np.asarray(image if image.mode == "RGBA" else image.convert("RGBA"))
+    frames.setflags(write=False)
+    return frames
 
 
 class AnimatedWebPLabel(QLabel):
+    # Emitted whenever the shown frame or the opacity changes, so the compositor knows to repaint.
+    changed = Signal()
+    # Final frame pixmaps shared across labels, keyed by the set_webp arguments.
+    _FRAME_CACHE = {}
+    # Column-shaped alpha ramps for apply_gradient, keyed by band height.
+    _GRADIENT_MASKS = {}
+
     def __init__(self, parent=None, initial_opacity=1.0):
         super().__init__(parent)
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.next_frame)
         self.frames = []
         self.current_frame = 0
+        # Index of the frame currently set on the label, or None before the first one.
+        self._shown_frame = None
 
-        # Set up the opacity effect
-        self.opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(self.opacity_effect)
-        self.opacity_effect.setOpacity(initial_opacity)  # Start with given opacity
+        # Opacity is applied by _BackgroundCompositor when it blends this label's frame, instead of through
+        # a QGraphicsOpacityEffect, which would render the label into its own offscreen layer.
+        self._opacity = initial_opacity  # Start with given opacity
 
         # Create an animation for opacity changes
-        self.fade_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
+        self.fade_animation = QVariantAnimation(self)
+        self.fade_animation.valueChanged.connect(self._set_opacity_value)
         self.fade_animation.setDuration(1000)  # Default duration (ms)
         self.fade_animation.setEasingCurve(QEasingCurve.InOutQuad)
 
@@ -902,116 +1237,103 @@ class AnimatedWebPLabel(QLabel):
         Returns:
             PIL.Image: The hue-adjusted image (alpha resets).
         """
+        from PIL import Image
+
         # Convert hue from degrees (-180 to +180) to a shift on a 0–255 scale.
-        shift = int((hue / 360.0) * 255)
-        hsv = image.convert("HSV")
-        h, s, v = hsv.split()
+        shift = np.uint8(int((hue / 360.0) * 255) & 0xFF)
+        h, s, v = image.convert("HSV").split()
+        # Only the hue plane goes through NumPy; uint8 addition wraps around at 256 in place.
         np_h = np.array(h, dtype=np.uint8)
-        # Shift hue values with wrap-around
-        np_h = (np_h.astype(int) + shift) % 256
-        new_h = Image.fromarray(np_h.astype("uint8"), "L")
-        hsv = Image.merge("HSV", (new_h, s, v))
-        return hsv.convert("RGBA")
+        np.add(np_h, shift, out=np_h)
+        return Image.merge("HSV", (Image.fromarray(np_h, "L"), s, v)).convert("RGBA")
 
-    def adjust_frame(self, frame, hue, saturation, brightness=0, region=None):
+    def adjust_frame(self, frames, hue, saturation, brightness=0, region=None):
         """
-        Adjust the hue, saturation, and brightness of the frame while preserving non-opaque pixels
-        outside the specified region.
+        Adjust the hue, saturation, and brightness of one frame or a stack of frames in place while
+        preserving the original alpha channel and non-opaque pixels inside the specified region.
 
         Parameters:
-            frame (PIL.Image): An RGBA image.
+            frames (numpy.ndarray): RGBA uint8 array shaped (height, width, 4) or (count, height, width, 4).
             hue (float): Hue shift in degrees.
             saturation (float): Saturation factor (1.0 means no change).
             brightness (float): Brightness adjustment (-150 to 150; 0 means no change).
             region (tuple or None): Optional (x, y, width, height) region to apply adjustments.
 
         Returns:
-            PIL.Image: The adjusted image.
+            numpy.ndarray: The adjusted array (the same object that was passed in).
         """
+        from PIL import Image
+
         if region:
             x, y, w, h = region
-            region_box = (x, y, x + w, y + h)
-            # Crop the region to modify.
-            orig_region = frame.crop(region_box)
-            mod_region = orig_region.copy()
-
-            if hue != 0.0:
-                mod_region = self.adjust_hue(mod_region, hue)
-            if saturation != 1.0:
-                enhancer = ImageEnhance.Color(mod_region)
-                mod_region = enhancer.enhance(saturation)
-            if brightness != 0:
-                enhancer = ImageEnhance.Brightness(mod_region)
-                factor = 1.0 + (brightness / 150.0)
-                mod_region = enhancer.enhance(factor)
-
-            # Convert cropped region to arrays to preserve translucency.
-            orig_arr = np.array(orig_region)
-            mod_arr = np.array(mod_region)
-            # Create a mask for pixels that are not fully opaque.
-            translucent_mask = (orig_arr[:, :, 3] < 255)
-            # For translucent pixels, revert to the original values.
-            mod_arr[translucent_mask] = orig_arr[translucent_mask]
-            mod_region = Image.fromarray(mod_arr, "RGBA")
-            # Paste the modified region back onto the original frame.
-            frame.paste(mod_region, region_box)
-            return frame
+            # View of the region to modify.
+            target = frames[..., y:y + h, x:x + w, :]
         else:
             # Adjust the entire frame.
-            orig = frame.copy()
-            mod = frame
-            if hue != 0.0:
-                mod = self.adjust_hue(mod, hue)
-            if saturation != 1.0:
-                enhancer = ImageEnhance.Color(mod)
-                mod = enhancer.enhance(saturation)
-            if brightness != 0:
-                enhancer = ImageEnhance.Brightness(mod)
-                factor = 1.0 + (brightness / 150.0)
-                mod = enhancer.enhance(factor)
-            orig_arr = np.array(orig)
-            mod_arr = np.array(mod)
-            # Preserve pixels that were originally transparent.
-            transparent_mask = (orig_arr[:, :, 3] == 0)
-            mod_arr[transparent_mask] = orig_arr[transparent_mask]
-            return Image.fromarray(mod_arr, "RGBA")
-
-    def apply_gradient(self, frame):
+            target = frames
+        # Only the alpha channel needs to survive the adjustments (the hue round trip resets it).
+        alpha = target[..., 3].copy()
+        if region:
+            # Pixels inside the region that are not fully opaque are left untouched, so save just those.
+            keep = alpha < 255
+            kept = target[keep]
+
+        if hue != 0.0:
+            # PIL does the HSV round trip one frame at a time.
+            for index in np.ndindex(target.shape[:-3]):
+                image = Image.fromarray(np.ascontiguousarray(target[index]), "RGBA")
+                target[index] = np.asarray(self.adjust_hue(image, hue))
+        if saturation != 1.0 or brightness != 0:
+            # Saturation and brightness as one fused color-matrix pass, a frame at a time through one
+            # reused float buffer instead of a float copy of the whole batch.
+            matrix = _color_matrix(saturation, brightness).T
+            rgb = np.empty(target.shape[-3:-1] + (3,), dtype=np.float32)
+            for index in np.ndindex(target.shape[:-3]):
+                frame = target[index]
+                np.matmul(frame[..., :3], matrix, out=rgb)
+                np.clip(rgb, 0, 255, out=rgb)
+                frame[..., :3] = rgb
+
+        # Restore the original transparency, translucent pixels included (the hue round trip would otherwise
+        # leave them fully opaque).
+        target[..., 3] = alpha
+        if region:
+            target[keep] = kept
+        return frames
+
+    def apply_gradient(self, frames):
         """
         Apply a vertical gradient over a 100-pixel band in the middle of the frame.
         Pixels above the band become fully transparent and within the band the alpha channel
         is linearly interpolated from 0 (transparent) to 1 (opaque), while pixels below the band remain opaque.
 
         Parameters:
-            frame (PIL.Image): An RGBA image.
+            frames (numpy.ndarray): RGBA uint8 array shaped (height, width, 4) or (count, height, width, 4).
 
         Returns:
-            PIL.Image: The image with the gradient applied.
+            numpy.ndarray: The array with the gradient applied in place.
         """
-        width, height = frame.size
-        frame_arr = np.array(frame)
+        height = frames.shape[-3]
 
         # Define the gradient band (100 pixels tall, centered vertically)
         gradient_band_height = 100
         start_y = (height - gradient_band_height) // 2
         end_y = start_y + gradient_band_height
 
-        # Create a 1D mask for each row.
-        mask = np.ones((height,), dtype=np.float32)
-        mask[:start_y] = 0.0  # Above the band: fully transparent.
-        # Create a linear gradient within the band: from transparent (0.0) to opaque (1.0)
-        mask[start_y:end_y] = np.linspace(0.0, 1.0, gradient_band_height, endpoint=True)
-        mask[end_y:] = 1.0  # Below the band: fully opaque.
-
-        # Expand the mask to the full image width.
-        mask = np.tile(mask[:, None], (1, width))
+        # Linear gradient for the rows within the band: from transparent (0.0) to opaque (1.0).
+        mask = self._GRADIENT_MASKS.get(gradient_band_height)
+        if mask is None:
+            mask = np.linspace(0.0, 1.0, gradient_band_height, endpoint=True, dtype=np.float32)[:, None]
+            self._GRADIENT_MASKS[gradient_band_height] = mask
 
-        # Apply the mask to the original alpha channel.
-        original_alpha = frame_arr[..., 3].astype(np.float32)
-        new_alpha = (original_alpha * mask).astype(np.uint8)
-        frame_arr[..., 3] = new_alpha
+        # Above the band: fully transparent. Below the band the alpha is left as it is.
+        frames[..., :start_y, :, 3] = 0
+        # Within the band, broadcast the row mask across the width instead of tiling it.
+        band_alpha = frames[..., start_y:end_y, :, 3].astype(np.float32)
+        band_alpha *= mask
+        frames[..., start_y:end_y, :, 3] = band_alpha
 
-        return Image.fromarray(frame_arr, "RGBA")
+        return frames
 
     def set_webp(self, webp_path, hue=0.0, saturation=1.0, brightness=0, region=None, gradient=False):
         """
@@ -1026,32 +1348,50 @@ class AnimatedWebPLabel(QLabel):
             region (tuple or None): Optional (x, y, width, height) region to apply hue/saturation/brightness adjustments.
             gradient (bool): If True, apply a vertical gradient to fade the top half of each frame to transparent.
         """
-        self.frames = []
         self.current_frame = 0
-        image = Image.open(webp_path)
-        try:
-            while True:
-                frame = image.convert("RGBA")
-                if hue != 0.0 or saturation != 1.0 or brightness != 0:
-                    frame = self.adjust_frame(frame, hue, saturation, brightness, region)
-                if gradient:
-                    frame = self.apply_gradient(frame)
-                width, height = frame.size
-                qimage = QImage(frame.tobytes(), width, height, QImage.Format_RGBA8888)
-                self.frames.append(QPixmap.fromImage(qimage))
-                image.seek(image.tell() + 1)
-        except EOFError:
-            pass
-
-        # Start cycling frames immediately if visible.
-        self.timer.start(42)  # ~24 FPS
-        self.update_frame()
+        key = (webp_path, hue, saturation, brightness, region, gradient)
+        frames = self._FRAME_CACHE.get(key)
+        if frames is None:
+            batch = _decode_frames(webp_path)
+            if hue != 0.0 or saturation != 1.0 or brightness != 0 or gradient:
+                # Work on a private copy of the shared decode, all frames at once.
+                batch = batch.copy()
+            if hue != 0.0 or saturation != 1.0 or brightness != 0:
+                self.adjust_frame(batch, hue, saturation, brightness, region)
+            if gradient:
+                self.apply_gradient(batch)
+            count, height, width, _ = batch.shape
+            # QImage views each frame of the batch without copying; fromImage copies it into the pixmap,
+            # so the batch only has to stay alive until then.
+            frames = tuple(
+                QPixmap.fromImage(QImage(batch[i].data, width, height, 4 * width, QImage.Format_RGBA8888))
+                for i in range(count)
+            )
+            self._FRAME_CACHE[key] = frames
+        self.frames = list(frames)
+        self._shown_frame = None
+
+        # Start cycling frames immediately if visible; hidden labels just hold their first frame
+        # until fade_in starts the timer.
+        if self._opacity > 0.0:
+            self.timer.start(42)  # ~24 FPS
+            self.update_frame()
+        elif self.frames:
+            self._show_frame(0)
 
     def update_frame(self):
-        if self.frames:
-            self.setPixmap(self.frames[self.current_frame])
+        # Nothing to show while fully transparent.
+        if self.frames and self._opacity > 0.0:
+            # Single-frame labels stop triggering repaints after their first frame.
+            if self.current_frame != self._shown_frame:
+                self._show_frame(self.current_frame)
             self.current_frame = (self.current_frame + 1) % len(self.frames)
 
+    def _show_frame(self, index):
+        self.setPixmap(self.frames[index])
+        self._shown_frame = index
+        self.changed.emit()
+
     def next_frame(self):
         self.update_frame()
 
@@ -1062,7 +1402,7 @@ class AnimatedWebPLabel(QLabel):
         self.current_frame = 0
         self.timer.start(42)
         self.fade_animation.setDuration(duration)
-        self.fade_animation.setStartValue(self.opacity_effect.opacity())
+        self.fade_animation.setStartValue(self._opacity)
         self.fade_animation.setEndValue(1.0)
         self.fade_animation.start()
 
@@ -1071,7 +1411,7 @@ class AnimatedWebPLabel(QLabel):
         self.fade_animation.stop()
         self._is_fading_out = True
         self.fade_animation.setDuration(duration)
-        self.fade_animation.setStartValue(self.opacity_effect.opacity())
+        self.fade_animation.setStartValue(self._opacity)
         self.fade_animation.setEndValue(0.0)
         # Connect to the finished signal to stop the timer after fade-out completes.
         self.fade_animation.finished.connect(self._on_fade_out_finished)
@@ -1089,7 +1429,15 @@ class AnimatedWebPLabel(QLabel):
     def set_opacity(self, opacity):
         """Immediately set the label's opacity without animation."""
         self.fade_animation.stop()
-        self.opacity_effect.setOpacity(opacity)
+        self._set_opacity_value(opacity)
+
+    def opacity(self):
+        """Return the label's current opacity."""
+        return self._opacity
+
+    def _set_opacity_value(self, opacity):
+        self._opacity = float(opacity)
+        self.changed.emit()
 
 
 class AnimatedAPNGLabel(QLabel):
@@ -1101,18 +1449,37 @@ class AnimatedAPNGLabel(QLabel):
         self.current_frame = 0
 
     def set_apng(self, apng_path):
-        self.frames = []
+        import imageio
+
         self.current_frame = 0
+        buffer = None
+        count = 0
         with imageio.get_reader(apng_path) as reader:
+            length = reader.get_length()
             for frame in reader:
-                image = np.array(frame)
-                height, width, channels = image.shape
-                if channels == 4:
-                    q_image = QImage(image.data, width, height, 4 * width, QImage.Format_RGBA8888)
-                else:
-                    q_image = QImage(image.data, width, height, 3 * width, QImage.Format_RGB888)
-                pixmap = QPixmap.fromImage(q_image)
-                self.frames.append(pixmap)
+                if buffer is None:
+                    height, width, channels = frame.shape
+                    buffer = np.empty((length, height, width, 4), dtype=np.uint8)
+                    if channels == 3:
+                        # Frames without an alpha channel are fully opaque.
+                        buffer[..., 3] = 255
+                if count == len(buffer):
+                    break
+                buffer[count, ..., :channels] = frame
+                count += 1
+        if not count:
+            logger.error("No frames decoded from %s", apng_path)
+            self.frames = []
+            self.timer.stop()
+            self.clear()
+            return
+        # Only the frames the reader actually produced; the rest of the buffer was never written.
+        # fromImage copies each frame out of the buffer, so it is released once the pixmaps exist.
+        buffer = buffer[:count]
+        self.frames = [
+            QPixmap.fromImage(QImage(buffer[i].data, width, height, 4 * width, QImage.Format_RGBA8888))
+            for i in range(count)
+        ]
         self.timer.start(42)  # ~24 FPS
         self.update_frame()
 
@@ -1129,6 +1496,36 @@ class AnimatedAPNGLabel(QLabel):
         self.update_frame()
 
 
+class _BackgroundCompositor(QWidget):
+    """
+    Paints a stack of AnimatedWebPLabel layers from a single widget.
+    The layers are hidden and only act as frame and opacity sources, so fully transparent ones
+    cost nothing and the visible ones are blended in one pass instead of one widget each.
+    """
+
+    def __init__(self, layers, parent=None):
+        super().__init__(parent)
+        self.layers = list(layers)
+        for layer in self.layers:
+            layer.setVisible(False)
+            # Repaint only when a layer shows a new frame or changes opacity; Qt merges the requests
+            # from one tick into a single paint.
+            layer.changed.connect(self.update)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        for layer in self.layers:
+            opacity = layer.opacity()
+            if opacity <= 0.0:
+                continue
+            pixmap = layer.pixmap()
+            if pixmap.isNull():
+                continue
+            painter.setOpacity(opacity)
+            painter.drawPixmap(layer.pos() - self.pos(), pixmap)
+        painter.end()
+
+
 class MainWindow(QMainWindow):
     def __init__(self, args=None):
         super().__init__()
@@ -1238,6 +1635,28 @@ class MainWindow(QMainWindow):
         self.webp_title_label.set_webp(os.path.join(self.rootpath,'all_card/title_box.png'))
         self.webp_title_label.setGeometry(full_rect)
 
+        # Blend the whole background stack from one widget, bottom layer first.
+        self.background = _BackgroundCompositor([
+            self.webp_border_label,
+            self.webp_main_token_label,
+            self.webp_main_spell_label,
+            self.webp_main_trap_label,
+            self.webp_main_label,
+            self.webp_main_normal_label,
+            self.webp_main_ritual_label,
+            self.webp_main_fusion_label,
+            self.webp_main_synchro_label,
+            self.webp_link_label,
+            self.webp_xyz_label,
+            self.webp_main_pendulum_label,
+            self.webp_artframe_label,
+            self.webp_desc_label,
+            self.webp_title_label,
+        ], self)
+        self.background.setGeometry(full_rect)
+        # Every variant now holds its own pixmaps, so the shared decodes are no longer needed.
+        _decode_frames.cache_clear()
+
         # --- Overlay Transition (Original Code) ---
         # PNG overlay with opacity effect.
         self.overlay = QLabel(self)
@@ -1249,6 +1668,11 @@ class MainWindow(QMainWindow):
         self.opacity_animation = QPropertyAnimation(self.opacity_effect, b"opacity")
         self.opacity_animation.setDuration(350)
         self.opacity_animation.setEasingCurve(QEasingCurve.InOutQuad)
+        # Card waiting to be swapped in once the current fade-out finishes.
+        self._pending_overlay = None
+        # Set when the fade-out finished before the pending card was delivered.
+        self._overlay_waiting = False
+        self.opacity_animation.finished.connect(self._on_overlay_faded)
 
         # Transition APNG overlay.
         self.transition_overlay = AnimatedAPNGLabel(self)
@@ -1335,9 +1759,10 @@ class MainWindow(QMainWindow):
             # Call fade_in or fade_out on the widget based on fade_method.
             getattr(widget, fade_method)(duration)
 
-    def set_overlay_custom(self, frame, card_pixmap):
+    def set_overlay_custom(self, frame, card_pixmap=None):
         """
         Changes the overlay image using the same fade and transition animation.
+        Without a card_pixmap the transition starts right away and the card is supplied later through deliver_overlay.
         """
         fadeout_duration = 250
         fadein_duration = 500
@@ -1370,7 +1795,11 @@ class MainWindow(QMainWindow):
             self.webp_artframe_label.fade_out(fadeout_duration)
 
 
-        self.opacity_animation.setStartValue(1.0)
+        self._pending_overlay = card_pixmap
+        self._overlay_waiting = False
+        # A card can arrive mid-fade, so stop the running animation and fade out from where it is.
+        self.opacity_animation.stop()
+        self.opacity_animation.setStartValue(self.opacity_effect.opacity())
         self.opacity_animation.setEndValue(0.0)
         self.opacity_animation.start()
 
@@ -1380,14 +1809,27 @@ class MainWindow(QMainWindow):
         # Play the transition sound effect.
         self.transition_sound.play()
 
-        timer = QTimer(self)
-        timer.setSingleShot(True)
-        timer.timeout.connect(lambda: self._update_overlay(card_pixmap))
-        timer.start(350)
+    def deliver_overlay(self, card_pixmap):
+        """Supply the card for a transition started by set_overlay_custom without one."""
+        self._pending_overlay = card_pixmap
+        if self._overlay_waiting:
+            self._show_pending_overlay()
+
+    def _on_overlay_faded(self):
+        """Swap in the pending card once the overlay has faded out, then fade it back in."""
+        if self.opacity_animation.endValue() != 0.0:
+            # The fade-in has finished.
+            return
+        if self._pending_overlay is None:
+            # The card is still rendering; deliver_overlay swaps it in.
+            self._overlay_waiting = True
+            return
+        self._show_pending_overlay()
 
-        loop = QEventLoop()
-        QTimer.singleShot(375, loop.quit)
-        loop.exec()
+    def _show_pending_overlay(self):
+        self._overlay_waiting = False
+        self._update_overlay(self._pending_overlay)
+        self._pending_overlay = None
 
         self.opacity_animation.setStartValue(0.0)
         self.opacity_animation.setEndValue(1.0)
@@ -1448,6 +1890,7 @@ if __name__ == "__main__":
 
     # Initialize the QApplication
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(100 * 1024)  # KB
 
     # --- Create and show the splash screen ---
     splash_pix = QPixmap(resource_path("splash1.png"))